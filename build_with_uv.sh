@@ -32,7 +32,7 @@ echo "Activating virtual environment..."
 source venv_build/bin/activate
 
 echo "Installing dependencies using uv..."
-uv pip install "PyQt5>=5.15.10" "PyMuPDF>=1.23.8" "pytesseract>=0.3.10" "pdf2image>=1.16.3" "Pillow>=10.2.0" "openpyxl>=3.1.2" "pyinstaller>=6.3.0"
+uv pip install "PyQt5>=5.15.10" "PyMuPDF>=1.23.8" "pytesseract>=0.3.10" "Pillow>=10.2.0" "openpyxl>=3.1.2" "pyinstaller>=6.3.0"
 
 echo "Building Linux executable with PyInstaller..."
 pyinstaller --clean word_estimator.spec
@@ -64,7 +64,7 @@ if [ "$WINE_AVAILABLE" = true ]; then
 
         echo "Installing dependencies in Windows environment..."
         $WINE_PYTHON -m pip install --upgrade pip
-        $WINE_PYTHON -m pip install "PyQt5>=5.15.10" "PyMuPDF>=1.23.8" "pytesseract>=0.3.10" "pdf2image>=1.16.3" "Pillow>=10.2.0" "openpyxl>=3.1.2" "pyinstaller>=6.3.0"
+        $WINE_PYTHON -m pip install "PyQt5>=5.15.10" "PyMuPDF>=1.23.8" "pytesseract>=0.3.10" "Pillow>=10.2.0" "openpyxl>=3.1.2" "pyinstaller>=6.3.0"
 
         echo "Building Windows executable with PyInstaller..."
         $WINE_PYTHON -m PyInstaller --clean word_estimator.spec
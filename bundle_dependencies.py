@@ -1,12 +1,11 @@
 #!/usr/bin/env python3
 """
-Script to download and prepare Tesseract and Poppler for bundling with PyInstaller.
+Script to download and prepare Tesseract for bundling with PyInstaller.
 Run this before building the executable.
 """
 
 import os
 import sys
-import zipfile
 import tarfile
 from pathlib import Path
 import urllib.request
@@ -23,20 +22,8 @@ def download_file(url, dest_path):
         print(f"✗ Failed to download: {e}")
         return False
 
-def extract_zip(zip_path, extract_to):
-    """Extract a ZIP file."""
-    print(f"Extracting {zip_path}...")
-    try:
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_to)
-        print(f"✓ Extracted to {extract_to}")
-        return True
-    except Exception as e:
-        print(f"✗ Failed to extract: {e}")
-        return False
-
 def setup_windows_dependencies():
-    """Download and setup Tesseract and Poppler for Windows."""
+    """Download and setup Tesseract for Windows."""
     deps_dir = Path("windows_deps")
     deps_dir.mkdir(exist_ok=True)
 
@@ -47,17 +34,6 @@ def setup_windows_dependencies():
     # Note: This is an installer, we need the portable version instead
     tesseract_portable_url = "https://github.com/UB-Mannheim/tesseract/releases/download/v5.3.3.20231005/tesseract-ocr-w64-setup-5.3.3.20231005.exe"
 
-    # Poppler for Windows
-    poppler_url = "https://github.com/oschwartz10612/poppler-windows/releases/download/v24.08.0-0/Release-24.08.0-0.zip"
-
-    # Download Poppler
-    poppler_zip = deps_dir / "poppler.zip"
-    if not poppler_zip.exists():
-        if download_file(poppler_url, poppler_zip):
-            extract_zip(poppler_zip, deps_dir / "poppler")
-    else:
-        print(f"Poppler already downloaded: {poppler_zip}")
-
     print("\n=== Manual Steps Required ===\n")
     print("Tesseract OCR cannot be automatically downloaded in portable format.")
     print("\nPlease follow these steps:")
@@ -73,7 +49,7 @@ def setup_linux_dependencies():
     """Setup instructions for Linux dependencies."""
     print("\n=== Linux dependencies ===\n")
     print("On Linux, dependencies are typically installed system-wide:")
-    print("  sudo apt-get install tesseract-ocr poppler-utils")
+    print("  sudo apt-get install tesseract-ocr")
     print("\nThe Linux build will use system dependencies.")
 
 if __name__ == "__main__":
@@ -85,4 +61,4 @@ if __name__ == "__main__":
         setup_linux_dependencies()
     else:
         print(f"Platform {platform} not explicitly supported by this script.")
-        print("Please install Tesseract and Poppler manually.")
+        print("Please install Tesseract manually.")
@@ -0,0 +1,972 @@
+"""
+Main window and background workers of the PDF Keyword Value Estimator.
+"""
+
+import csv
+import multiprocessing
+import re
+import sys
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import fitz  # PyMuPDF
+from PyQt5.QtCore import (
+    Qt, QThread, pyqtSignal, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+)
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import (
+    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
+    QPushButton, QLabel, QTableWidget, QTableWidgetItem, QTableView,
+    QFileDialog, QTextEdit, QMessageBox, QHeaderView, QGroupBox,
+    QProgressDialog
+)
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment
+
+from ocr_processing import (
+    OCR_PROCESS_COUNT, OCRCache, init_ocr_process, ocr_pdf_page, warm_up_ocr_process
+)
+
+
+@lru_cache(maxsize=256)
+def _compile_keyword_pattern(keyword: str) -> "re.Pattern":
+    """
+    Compile a case-insensitive pattern matching a keyword as a whole word.
+
+    Cached, so recalculating with unchanged keywords skips compilation.
+
+    Args:
+        keyword: Lower-cased keyword.
+
+    Returns:
+        The compiled pattern.
+    """
+    # Not preceded or followed by a word character
+    return re.compile(rf"(?<!\w){re.escape(keyword)}(?!\w)", re.IGNORECASE)
+
+
+class OCRWorker(QThread):
+    """Worker thread for text extraction and OCR processing to avoid blocking the UI."""
+
+    finished = pyqtSignal(str)
+    error = pyqtSignal(str)
+    warning = pyqtSignal(str)
+    pool_broken = pyqtSignal()
+    progress = pyqtSignal(int, str)
+
+    # Pages with images and fewer non-whitespace characters than this in
+    # their embedded text layer (scans, or only page numbers and stamps) are
+    # OCRed. Pages without images have nothing more to find.
+    MIN_CHARS_PER_TEXT_PAGE = 20
+
+    def __init__(
+        self,
+        pdf_path,
+        ocr_executor: ProcessPoolExecutor,
+        ocr_cache: Optional[OCRCache] = None
+    ):
+        super().__init__()
+        self.pdf_path = pdf_path
+        self.ocr_executor = ocr_executor
+        self.ocr_cache = ocr_cache
+
+    def run(self):
+        """Run text extraction and OCR processing in a separate thread."""
+        try:
+            # Use the embedded text layer where pages have one, it is much
+            # faster than OCR. Only scanned/image-based pages are OCRed.
+            self.progress.emit(0, "Opening PDF and reading its text layer...")
+            page_texts = []
+            ocr_page_indices = []
+            has_text_layer = False
+            with fitz.open(self.pdf_path) as doc:
+                total_pages = doc.page_count
+                for page_index, page in enumerate(doc):
+                    if self.isInterruptionRequested():
+                        return
+
+                    page_text = page.get_text("text")
+                    page_texts.append(page_text)
+                    if (len("".join(page_text.split())) < self.MIN_CHARS_PER_TEXT_PAGE
+                            and page.get_images()):
+                        ocr_page_indices.append(page_index)
+                    elif page_text.strip():
+                        has_text_layer = True
+
+            if total_pages == 0:
+                self.error.emit("No pages found in PDF")
+                return
+
+            if ocr_page_indices:
+                self.progress.emit(
+                    5,
+                    f"Found {total_pages} page(s), {len(ocr_page_indices)} without a "
+                    "text layer. Starting OCR..."
+                )
+                try:
+                    if not self.ocr_pages(ocr_page_indices, page_texts):
+                        return  # Cancelled
+                except Exception as e:
+                    if isinstance(e, BrokenProcessPool):
+                        # An OCR process died, the pool can't run any more pages
+                        self.pool_broken.emit()
+                    if not has_text_layer:
+                        raise
+
+                    # Still count keywords in the pages that have a text layer
+                    self.warning.emit(
+                        f"OCR failed, scanned pages were skipped: {str(e)}"
+                    )
+
+            text = "\n".join(page_texts)
+
+            self.progress.emit(100, "Text extraction complete!")
+            self.finished.emit(text)
+
+        except Exception as e:
+            self.error.emit(f"OCR Error: {str(e)}")
+
+    def ocr_pages(self, page_indices: List[int], page_texts: List[str]) -> bool:
+        """
+        OCR pages of the PDF in parallel.
+
+        Args:
+            page_indices: Zero-based numbers of the pages to OCR.
+            page_texts: Text of every page, replaced for the OCRed pages.
+
+        Returns:
+            False if cancelled before all pages were OCRed.
+        """
+        total_pages = len(page_indices)
+
+        # Each OCR process opens the PDF once and renders the pages it OCRs,
+        # so rendering runs in parallel too and page images never cross
+        # process boundaries. Queue only a few pages ahead of the OCR
+        # processes, so that cancelling has little to drop.
+        max_pages_in_flight = 2 * OCR_PROCESS_COUNT
+
+        futures = {}
+        completed = 0
+        next_position = 0
+
+        # At most ~10 progress updates per second
+        min_progress_interval = 0.1
+        last_progress_time = 0.0
+        progress_suffix = f" of {total_pages} page(s)..."
+
+        try:
+            while next_position < total_pages or futures:
+                if self.isInterruptionRequested():
+                    return False
+
+                # Queue pages for OCR, unless their text is already cached
+                while next_position < total_pages and len(futures) < max_pages_in_flight:
+                    page_index = page_indices[next_position]
+                    next_position += 1
+
+                    page_key = None
+                    if self.ocr_cache:
+                        page_key = self.ocr_cache.page_key(self.pdf_path, page_index)
+                        cached_text = self.ocr_cache.get_page(page_key)
+                        if cached_text is not None:
+                            page_texts[page_index] = cached_text
+                            completed += 1
+                            continue
+
+                    future = self.ocr_executor.submit(ocr_pdf_page, self.pdf_path, page_index)
+                    futures[future] = (page_index, page_key)
+
+                if not futures:
+                    continue
+
+                # Collect OCR results as pages complete, kept in page order
+                done, _ = wait(futures, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    page_index, page_key = futures.pop(future)
+                    page_texts[page_index], content_key = future.result()
+                    if self.ocr_cache:
+                        self.ocr_cache.put_page(page_key, content_key)
+                    completed += 1
+
+                # Throttle progress updates so the UI's event queue doesn't
+                # back up when pages complete quickly
+                now = time.monotonic()
+                if done and (now - last_progress_time >= min_progress_interval
+                             or completed == total_pages):
+                    last_progress_time = now
+                    self.progress.emit(
+                        5 + int((completed / total_pages) * 90),
+                        f"OCRed {completed}{progress_suffix}"
+                    )
+
+        finally:
+            # Drop queued pages on cancel or error, without waiting for
+            # the pages already being processed. The processes are kept
+            # for the next run.
+            for future in futures:
+                future.cancel()
+
+        if self.ocr_cache:
+            self.ocr_cache.prune()
+
+        return True
+
+
+class OCRWarmupWorker(QThread):
+    """Worker thread that starts an OCR process and loads Tesseract ahead of the first OCR run."""
+
+    unavailable = pyqtSignal(str)
+
+    def __init__(self, ocr_executor: ProcessPoolExecutor):
+        super().__init__()
+        self.ocr_executor = ocr_executor
+
+    def run(self):
+        """Warm up a single OCR process in a separate thread."""
+        # The pool starts further processes only once OCR needs them
+        # (Python 3.9+), so idle users pay for one process, not one per core
+        try:
+            problem = self.ocr_executor.submit(warm_up_ocr_process).result()
+        except RuntimeError:
+            return  # The pool was shut down, OCR problems are reported when it runs
+        except Exception as e:
+            problem = str(e)
+
+        if problem:
+            self.unavailable.emit(problem)
+
+
+class ResultsModel(QAbstractTableModel):
+    """Table model for calculation results, followed by a grand total row."""
+
+    HEADERS = ["Keyword", "Count", "Value", "Subtotal"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._grand_total = None  # No results yet
+
+        self._bold_font = QFont()
+        self._bold_font.setBold(True)
+
+    def set_rows(self, rows: List[Tuple[str, int, int, int]], grand_total: int):
+        """
+        Replace the displayed results.
+
+        Args:
+            rows: List of tuples containing (keyword, count, value, subtotal)
+            grand_total: Sum of all subtotals, shown in the last row
+        """
+        self.beginResetModel()
+        self._rows = rows
+        self._grand_total = grand_total
+        self.endResetModel()
+
+    def is_total_row(self, row: int) -> bool:
+        """Check whether a row is the grand total row."""
+        return row == len(self._rows)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        if self._grand_total is None:
+            return 0
+        # Result rows plus the grand total row
+        return len(self._rows) + 1
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row, column = index.row(), index.column()
+        is_total = self.is_total_row(row)
+
+        if role == Qt.DisplayRole:
+            if is_total:
+                return ("GRAND TOTAL", "", "", self._grand_total)[column]
+            return self._rows[row][column]
+
+        if role == Qt.TextAlignmentRole:
+            # Keyword column left-aligned, numeric columns right-aligned
+            if column == 0:
+                return Qt.AlignLeft | Qt.AlignVCenter
+            return Qt.AlignRight | Qt.AlignVCenter
+
+        if role == Qt.FontRole and is_total and column in (0, 3):
+            return self._bold_font
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+
+
+class ResultsSortProxyModel(QSortFilterProxyModel):
+    """Sorts results by any column while keeping the grand total row last."""
+
+    def lessThan(self, left, right):
+        model = self.sourceModel()
+        ascending = self.sortOrder() == Qt.AscendingOrder
+
+        if model.is_total_row(left.row()):
+            return not ascending
+        if model.is_total_row(right.row()):
+            return ascending
+
+        return super().lessThan(left, right)
+
+
+class KeywordEstimatorApp(QMainWindow):
+    """Main application window for PDF keyword value estimation."""
+
+    def __init__(self):
+        super().__init__()
+        self.pdf_path = None
+        self.ocr_worker = None
+        self.progress_dialog = None
+        self.keywords_file = Path.home() / ".word_estimator" / "keywords.csv"
+        self.ocr_cache = OCRCache(Path.home() / ".word_estimator" / "ocr_cache")
+        self.ocr_executor = None
+        self.current_results = None  # Sorted results, shared with Excel export
+        self.current_grand_total = 0
+        self.init_ui()
+        self.load_keywords()
+
+        # Start the OCR processes and warm up Tesseract without blocking startup
+        self.ocr_warmup_worker = OCRWarmupWorker(self.get_ocr_executor())
+        self.ocr_warmup_worker.unavailable.connect(self.on_ocr_unavailable)
+        self.ocr_warmup_worker.start()
+
+    def get_ocr_executor(self) -> ProcessPoolExecutor:
+        """Get or create the pool of OCR processes, shared by all OCR runs."""
+        if self.ocr_executor is None:
+            self.ocr_executor = ProcessPoolExecutor(
+                max_workers=OCR_PROCESS_COUNT,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=init_ocr_process,
+                initargs=(self.ocr_cache,)
+            )
+        return self.ocr_executor
+
+    def shutdown_ocr_executor(self):
+        """Stop the OCR processes without waiting for pages still being processed."""
+        if self.ocr_executor is not None:
+            self.ocr_executor.shutdown(wait=False)
+            self.ocr_executor = None
+
+    def closeEvent(self, event):
+        """Stop background work before the window closes."""
+        if self.ocr_worker and self.ocr_worker.isRunning():
+            self.ocr_worker.requestInterruption()
+            self.ocr_worker.wait()
+        self.ocr_warmup_worker.wait()
+        self.shutdown_ocr_executor()
+        super().closeEvent(event)
+
+    def get_keywords_dir(self) -> Path:
+        """Get or create the keywords directory."""
+        keywords_dir = Path.home() / ".word_estimator"
+        keywords_dir.mkdir(parents=True, exist_ok=True)
+        return keywords_dir
+
+    def load_keywords(self):
+        """Load keywords from CSV file and populate the table."""
+        try:
+            if not self.keywords_file.exists():
+                return
+
+            with open(self.keywords_file, 'r', encoding='utf-8') as f:
+                reader = csv.reader(f)
+                keywords = list(reader)
+
+            if not keywords:
+                return
+
+            # Disable repaints and signals while populating
+            self.keywords_table.setUpdatesEnabled(False)
+            self.keywords_table.blockSignals(True)
+
+            try:
+                # Clear existing table
+                self.keywords_table.clearContents()
+                self.keywords_table.setRowCount(len(keywords))
+
+                # Populate table with loaded keywords
+                for row, (keyword, value) in enumerate(keywords):
+                    self.keywords_table.setItem(row, 0, QTableWidgetItem(keyword))
+                    self.keywords_table.setItem(row, 1, QTableWidgetItem(value))
+            finally:
+                self.keywords_table.blockSignals(False)
+                self.keywords_table.setUpdatesEnabled(True)
+
+        except Exception as e:
+            QMessageBox.warning(
+                self,
+                "Load Error",
+                f"Could not load keywords from file:\n{str(e)}\n\nStarting with empty table."
+            )
+
+    def save_keywords(self):
+        """Save keywords from table to CSV file (silent mode for auto-save)."""
+        try:
+            # Ensure directory exists
+            self.get_keywords_dir()
+
+            # Get all keywords from table
+            keywords = []
+            for row in range(self.keywords_table.rowCount()):
+                keyword_item = self.keywords_table.item(row, 0)
+                value_item = self.keywords_table.item(row, 1)
+
+                if keyword_item and value_item:
+                    keyword = keyword_item.text().strip()
+                    value = value_item.text().strip()
+
+                    if keyword and value:
+                        keywords.append([keyword, value])
+
+            # Write to CSV
+            with open(self.keywords_file, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerows(keywords)
+
+        except Exception as e:
+            QMessageBox.critical(
+                self,
+                "Save Error",
+                f"Could not save keywords to file:\n{str(e)}"
+            )
+
+    def manual_save_keywords(self):
+        """Manually save keywords with user confirmation."""
+        self.save_keywords()
+        QMessageBox.information(
+            self,
+            "Keywords Saved",
+            f"Keywords have been saved to:\n{self.keywords_file}"
+        )
+
+    def init_ui(self):
+        """Initialize the user interface."""
+        self.setWindowTitle("PDF Keyword Value Estimator")
+        self.showMaximized()  # Start in fullscreen/maximized mode
+
+        # Create central widget and main layout
+        central_widget = QWidget()
+        self.setCentralWidget(central_widget)
+        main_layout = QVBoxLayout(central_widget)
+        main_layout.setSpacing(15)
+
+        # PDF File Selection Section
+        file_group = QGroupBox("1. Select PDF File")
+        file_layout = QHBoxLayout()
+
+        self.file_label = QLabel("No file selected")
+        self.file_label.setStyleSheet("color: #666;")
+        file_layout.addWidget(self.file_label, stretch=1)
+
+        self.browse_btn = QPushButton("Browse...")
+        self.browse_btn.clicked.connect(self.browse_pdf)
+        self.browse_btn.setMinimumWidth(100)
+        file_layout.addWidget(self.browse_btn)
+
+        file_group.setLayout(file_layout)
+        main_layout.addWidget(file_group)
+
+        # Keywords Input Section
+        keywords_group = QGroupBox("2. Enter Keywords and Values")
+        keywords_layout = QVBoxLayout()
+
+        # Table for keywords and values
+        self.keywords_table = QTableWidget()
+        self.keywords_table.setColumnCount(2)
+        self.keywords_table.setHorizontalHeaderLabels(["Keyword", "Value (Integer)"])
+        self.keywords_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.keywords_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        self.keywords_table.setRowCount(5)  # Start with 5 empty rows
+        keywords_layout.addWidget(self.keywords_table)
+
+        # Buttons for table management
+        table_buttons_layout = QHBoxLayout()
+
+        self.add_row_btn = QPushButton("Add Row")
+        self.add_row_btn.clicked.connect(self.add_table_row)
+        table_buttons_layout.addWidget(self.add_row_btn)
+
+        self.remove_row_btn = QPushButton("Remove Selected Row")
+        self.remove_row_btn.clicked.connect(self.remove_table_row)
+        table_buttons_layout.addWidget(self.remove_row_btn)
+
+        self.clear_table_btn = QPushButton("Clear All")
+        self.clear_table_btn.clicked.connect(self.clear_table)
+        table_buttons_layout.addWidget(self.clear_table_btn)
+
+        table_buttons_layout.addStretch()
+
+        self.save_keywords_btn = QPushButton("Save Keywords")
+        self.save_keywords_btn.clicked.connect(self.manual_save_keywords)
+        table_buttons_layout.addWidget(self.save_keywords_btn)
+
+        self.load_keywords_btn = QPushButton("Reload Keywords")
+        self.load_keywords_btn.clicked.connect(self.load_keywords)
+        table_buttons_layout.addWidget(self.load_keywords_btn)
+
+        keywords_layout.addLayout(table_buttons_layout)
+
+        keywords_group.setLayout(keywords_layout)
+        main_layout.addWidget(keywords_group)
+
+        # Calculate Button
+        self.calculate_btn = QPushButton("Calculate Total")
+        self.calculate_btn.clicked.connect(self.calculate_total)
+        self.calculate_btn.setMinimumHeight(40)
+        font = QFont()
+        font.setBold(True)
+        font.setPointSize(11)
+        self.calculate_btn.setFont(font)
+        self.calculate_btn.setStyleSheet("background-color: #4CAF50; color: white;")
+        main_layout.addWidget(self.calculate_btn)
+
+        # Extracted Text Section
+        extracted_group = QGroupBox("3. Extracted Text Preview")
+        extracted_layout = QVBoxLayout()
+
+        self.extracted_text = QTextEdit()
+        self.extracted_text.setReadOnly(True)
+        self.extracted_text.setMinimumHeight(250)
+        self.extracted_text.setPlaceholderText("Extracted text from PDF will appear here after processing...")
+        font = QFont("Arial")
+        font.setPointSize(9)
+        self.extracted_text.setFont(font)
+        extracted_layout.addWidget(self.extracted_text)
+
+        extracted_group.setLayout(extracted_layout)
+        main_layout.addWidget(extracted_group)
+
+        # Results Section
+        results_group = QGroupBox("4. Calculation Results")
+        results_layout = QVBoxLayout()
+
+        self.results_model = ResultsModel(self)
+        self.results_proxy = ResultsSortProxyModel(self)
+        self.results_proxy.setSourceModel(self.results_model)
+        self.results_proxy.setSortCaseSensitivity(Qt.CaseInsensitive)
+
+        self.results_table = QTableView()
+        self.results_table.setModel(self.results_proxy)
+        self.results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.results_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        self.results_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeToContents)
+        self.results_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        self.results_table.setMinimumHeight(200)
+        self.results_table.setSortingEnabled(True)
+        self.results_table.sortByColumn(0, Qt.AscendingOrder)
+        self.results_table.setEditTriggers(QTableView.NoEditTriggers)  # Read-only
+        self.results_table.setSelectionBehavior(QTableView.SelectRows)
+        results_layout.addWidget(self.results_table)
+
+        # Export button
+        self.export_btn = QPushButton("Export to Excel")
+        self.export_btn.clicked.connect(self.export_to_excel)
+        self.export_btn.setEnabled(False)  # Disabled until results are calculated
+        self.export_btn.setMinimumHeight(35)
+        results_layout.addWidget(self.export_btn)
+
+        results_group.setLayout(results_layout)
+        main_layout.addWidget(results_group)
+
+    def browse_pdf(self):
+        """Open file dialog to select a PDF file."""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self,
+            "Select PDF File",
+            "",
+            "PDF Files (*.pdf);;All Files (*)"
+        )
+
+        if file_path:
+            self.pdf_path = file_path
+            self.file_label.setText(Path(file_path).name)
+            self.file_label.setStyleSheet("color: #000; font-weight: bold;")
+
+    def add_table_row(self):
+        """Add a new row to the keywords table."""
+        row_count = self.keywords_table.rowCount()
+        self.keywords_table.insertRow(row_count)
+
+    def remove_table_row(self):
+        """Remove the selected row from the keywords table."""
+        current_row = self.keywords_table.currentRow()
+        if current_row >= 0:
+            self.keywords_table.removeRow(current_row)
+        else:
+            QMessageBox.warning(self, "No Selection", "Please select a row to remove.")
+
+    def clear_table(self):
+        """Clear all entries in the keywords table."""
+        self.keywords_table.clearContents()
+
+    def get_keywords_from_table(self) -> Dict[str, int]:
+        """
+        Extract keywords and values from the table.
+
+        Returns:
+            Dictionary mapping keywords to their integer values.
+        """
+        keywords = {}
+
+        for row in range(self.keywords_table.rowCount()):
+            keyword_item = self.keywords_table.item(row, 0)
+            value_item = self.keywords_table.item(row, 1)
+
+            if keyword_item and value_item:
+                keyword = keyword_item.text().strip()
+                value_text = value_item.text().strip()
+
+                if keyword and value_text:
+                    try:
+                        value = int(value_text)
+                        keywords[keyword] = value
+                    except ValueError:
+                        QMessageBox.warning(
+                            self,
+                            "Invalid Value",
+                            f"Value for keyword '{keyword}' must be an integer. Skipping this entry."
+                        )
+
+        return keywords
+
+    def extract_text_with_ocr(self, pdf_path: str, keywords: Dict[str, int]):
+        """
+        Extract text from PDF, using OCR for pages without a text layer.
+        Runs in a separate thread with progress dialog.
+
+        Args:
+            pdf_path: Path to the PDF file.
+            keywords: Dictionary of keywords for processing after OCR.
+        """
+        # Create and configure progress dialog
+        self.progress_dialog = QProgressDialog(
+            "Extracting text...",
+            "Cancel",
+            0,
+            100,
+            self
+        )
+        self.progress_dialog.setWindowTitle("Text Extraction")
+        self.progress_dialog.setWindowModality(Qt.WindowModal)
+        self.progress_dialog.setMinimumDuration(0)
+        self.progress_dialog.setValue(0)
+
+        # Create OCR worker thread
+        self.ocr_worker = OCRWorker(pdf_path, self.get_ocr_executor(), self.ocr_cache)
+
+        # Connect signals
+        self.ocr_worker.progress.connect(self.on_ocr_progress)
+        self.ocr_worker.finished.connect(lambda text: self.on_ocr_finished(text, keywords))
+        self.ocr_worker.error.connect(self.on_ocr_error)
+        self.ocr_worker.warning.connect(self.on_ocr_warning)
+        self.ocr_worker.pool_broken.connect(self.shutdown_ocr_executor)
+        self.progress_dialog.canceled.connect(self.on_ocr_canceled)
+
+        # Start OCR processing
+        self.ocr_worker.start()
+
+    def on_ocr_progress(self, value: int, message: str):
+        """Update progress dialog during OCR processing."""
+        if self.progress_dialog:
+            self.progress_dialog.setValue(value)
+            self.progress_dialog.setLabelText(message)
+
+    def on_ocr_finished(self, text: str, keywords: Dict[str, int]):
+        """Handle successful OCR completion."""
+        if self.progress_dialog:
+            self.progress_dialog.close()
+
+        if not text.strip():
+            QMessageBox.warning(
+                self,
+                "No Text Found",
+                "Text extraction completed but no text was found in the PDF. "
+                "The PDF might be empty or the images might not contain readable text."
+            )
+            return
+
+        # Display extracted text
+        self.display_extracted_text(text)
+
+        # Count keywords and display results
+        results = self.count_keywords(text, keywords)
+        self.display_results(results)
+
+    def on_ocr_unavailable(self, problem: str):
+        """Report that OCR can't run, without interrupting PDFs that have a text layer."""
+        self.statusBar().showMessage(
+            f"OCR unavailable: {problem} Scanned pages can't be processed until "
+            "Tesseract OCR is installed."
+        )
+
+        # Don't keep an OCR process that can't OCR, the pool is created
+        # again if a scanned page needs it
+        if not (self.ocr_worker and self.ocr_worker.isRunning()):
+            self.shutdown_ocr_executor()
+
+    def on_ocr_warning(self, message: str):
+        """Report a problem that didn't stop the calculation."""
+        self.statusBar().showMessage(message)
+
+    def on_ocr_error(self, error_message: str):
+        """Handle OCR processing errors."""
+        if self.progress_dialog:
+            self.progress_dialog.close()
+
+        # Detect specific errors and provide helpful messages
+        error_lower = error_message.lower()
+
+        if "tesseract" in error_lower and "not found" in error_lower:
+            detailed_msg = (
+                f"{error_message}\n\n"
+                "Tesseract OCR is not installed or not in your system PATH.\n\n"
+                "Windows users:\n"
+                "1. Download and run setup_windows_deps.bat (as administrator)\n"
+                "   OR\n"
+                "2. Install manually from: https://github.com/UB-Mannheim/tesseract/wiki\n\n"
+                "Linux users:\n"
+                "   sudo apt-get install tesseract-ocr\n\n"
+                "macOS users:\n"
+                "   brew install tesseract"
+            )
+        else:
+            detailed_msg = (
+                f"{error_message}\n\n"
+                "Please ensure Tesseract OCR is properly installed on your system.\n\n"
+                "Windows: Run setup_windows_deps.bat as administrator\n"
+                "Linux: sudo apt-get install tesseract-ocr\n"
+                "macOS: brew install tesseract"
+            )
+
+        QMessageBox.critical(
+            self,
+            "OCR Error - Missing Dependencies",
+            detailed_msg
+        )
+
+    def on_ocr_canceled(self):
+        """Handle OCR cancellation."""
+        if self.ocr_worker and self.ocr_worker.isRunning():
+            self.ocr_worker.requestInterruption()
+            self.ocr_worker.wait()
+
+    def count_keywords(self, text: str, keywords: Dict[str, int]) -> List[Tuple[str, int, int, int]]:
+        """
+        Count whole-word occurrences of keywords in text (case-insensitive).
+
+        Args:
+            text: Text to search in.
+            keywords: Dictionary mapping keywords to their values.
+
+        Returns:
+            List of tuples: (keyword, count, value, subtotal)
+        """
+        results = []
+
+        counts = {}
+
+        # Keywords differing only in case are counted once
+        simple_keywords = {keyword.lower() for keyword in keywords if keyword.isalnum()}
+        complex_keywords = {keyword.lower() for keyword in keywords if not keyword.isalnum()}
+
+        # Plain alphanumeric keywords: split the lower-cased text into words
+        # once, then each keyword is a single lookup
+        if simple_keywords:
+            word_counts = Counter(re.findall(r"\w+", text.lower()))
+            for keyword in simple_keywords:
+                counts[keyword] = word_counts[keyword]
+
+        # Keywords with spaces or punctuation: one regex pass per keyword, so
+        # keywords that overlap in the text (e.g. "new york" and "york city")
+        # are each counted in full
+        for keyword in complex_keywords:
+            pattern = _compile_keyword_pattern(keyword)
+            counts[keyword] = len(pattern.findall(text))
+
+        for keyword, value in keywords.items():
+            count = counts[keyword.lower()]
+            subtotal = count * value
+            results.append((keyword, count, value, subtotal))
+
+        return results
+
+    def calculate_total(self):
+        """Main calculation function triggered by the Calculate button."""
+        # Validate PDF file is selected
+        if not self.pdf_path:
+            QMessageBox.warning(self, "No PDF Selected", "Please select a PDF file first.")
+            return
+
+        # Get keywords from table
+        keywords = self.get_keywords_from_table()
+
+        if not keywords:
+            QMessageBox.warning(
+                self,
+                "No Keywords",
+                "Please enter at least one keyword with a value."
+            )
+            return
+
+        # Auto-save keywords before processing
+        self.save_keywords()
+
+        try:
+            # Extract the text layer and OCR scanned/image-based pages
+            self.extract_text_with_ocr(self.pdf_path, keywords)
+
+        except Exception as e:
+            QMessageBox.critical(self, "Error", str(e))
+
+    def display_extracted_text(self, text: str):
+        """
+        Display extracted text in the extracted text preview area.
+
+        Args:
+            text: The extracted text to display
+        """
+        # Limit display to first 5000 characters to avoid UI lag
+        max_chars = 5000
+        display_text = text[:max_chars]
+
+        if len(text) > max_chars:
+            display_text += f"\n\n... (showing first {max_chars} characters of {len(text)} total)"
+
+        self.extracted_text.setText(display_text)
+
+    def display_results(self, results: List[Tuple[str, int, int, int]]):
+        """
+        Display calculation results in the results table.
+
+        Args:
+            results: List of tuples containing (keyword, count, value, subtotal)
+        """
+        # Sort and total once; the Excel export reuses both
+        self.current_results = sorted(results, key=lambda x: x[0].lower())
+        self.current_grand_total = sum(subtotal for _, _, _, subtotal in results)
+
+        # Replace all rows at once, the proxy model keeps the current sort order
+        self.results_model.set_rows(self.current_results, self.current_grand_total)
+
+        # Enable export button
+        self.export_btn.setEnabled(True)
+
+    def export_to_excel(self):
+        """Export calculation results to Excel file."""
+        if not self.current_results:
+            QMessageBox.warning(self, "No Results", "No results to export. Please calculate first.")
+            return
+
+        # Generate default filename with PDF name
+        if self.pdf_path:
+            pdf_name = Path(self.pdf_path).stem  # Get filename without extension
+            # Sanitize filename (remove special characters)
+            pdf_name = "".join(c for c in pdf_name if c.isalnum() or c in (' ', '-', '_')).strip()
+            default_filename = f"{pdf_name}_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        else:
+            default_filename = f"keyword_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Save Excel File",
+            str(Path.home() / default_filename),
+            "Excel Files (*.xlsx);;All Files (*)"
+        )
+
+        if not file_path:
+            return  # User cancelled
+
+        try:
+            # Create a write-only workbook, rows are streamed straight to the file
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Keyword Results")
+
+            # Adjust column widths (must be set before any rows are written)
+            ws.column_dimensions['A'].width = 30  # Keyword
+            ws.column_dimensions['B'].width = 12  # Count
+            ws.column_dimensions['C'].width = 12  # Value
+            ws.column_dimensions['D'].width = 15  # Subtotal
+
+            # Shared styles: bold headers/total, right-aligned numeric columns
+            header_font = Font(bold=True)
+            header_alignment = Alignment(horizontal='center')
+            numeric_alignment = Alignment(horizontal='right')
+
+            def styled_cell(value, font=None, alignment=None):
+                cell = WriteOnlyCell(ws, value=value)
+                if font:
+                    cell.font = font
+                if alignment:
+                    cell.alignment = alignment
+                return cell
+
+            # Add headers (bold, centered)
+            headers = ["Keyword", "Count", "Value", "Subtotal"]
+            ws.append([styled_cell(header, header_font, header_alignment) for header in headers])
+
+            # Add data rows (already sorted by display_results)
+            for keyword, count, value, subtotal in self.current_results:
+                ws.append([
+                    keyword,
+                    styled_cell(count, alignment=numeric_alignment),
+                    styled_cell(value, alignment=numeric_alignment),
+                    styled_cell(subtotal, alignment=numeric_alignment),
+                ])
+
+            # Add grand total row (bold)
+            ws.append([
+                styled_cell("GRAND TOTAL", header_font),
+                styled_cell("", alignment=numeric_alignment),
+                styled_cell("", alignment=numeric_alignment),
+                styled_cell(self.current_grand_total, header_font, numeric_alignment),
+            ])
+
+            # Save workbook
+            wb.save(file_path)
+
+            QMessageBox.information(
+                self,
+                "Export Successful",
+                f"Results exported successfully to:\n{file_path}"
+            )
+
+        except Exception as e:
+            QMessageBox.critical(
+                self,
+                "Export Error",
+                f"Could not export to Excel:\n{str(e)}"
+            )
+
+
+def main():
+    """Main entry point for the application."""
+    app = QApplication(sys.argv)
+
+    # Set application style
+    app.setStyle('Fusion')
+
+    window = KeywordEstimatorApp()
+    window.show()
+
+    sys.exit(app.exec_())
@@ -0,0 +1,344 @@
+"""
+OCR worker processes for the PDF Keyword Value Estimator.
+
+Runs in the processes of the OCR process pool. Kept free of the GUI
+dependencies, so spawning an OCR process only loads what OCR needs.
+"""
+
+import hashlib
+import multiprocessing.util
+import os
+import shutil
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import fitz  # PyMuPDF
+import pytesseract
+from PIL import Image
+
+try:
+    import tesserocr
+except ImportError:  # Optional, OCR falls back to the pytesseract subprocess
+    tesserocr = None
+
+# Pages are OCRed in parallel, one Tesseract process per core. Tesseract's
+# own OpenMP threading then only causes contention, so disable it.
+OCR_PROCESS_COUNT = os.cpu_count() or 1
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+
+# State of an OCR worker process: the PDF being processed and the file
+# identity it was opened with, the OCR result cache, and the Tesseract API
+# when tesserocr is available
+_ocr_document = None
+_ocr_document_identity = None
+_ocr_cache = None
+_tesserocr_api = None
+
+
+def init_ocr_process(ocr_cache: Optional["OCRCache"]):
+    """
+    Prepare an OCR worker process: load the Tesseract model once.
+
+    Args:
+        ocr_cache: Cache for OCR results by page image, or None.
+    """
+    global _ocr_cache, _tesserocr_api
+
+    _ocr_cache = ocr_cache
+
+    # Close the document and the Tesseract API when the process exits
+    multiprocessing.util.Finalize(None, _close_ocr_process, exitpriority=10)
+
+    if tesserocr is None:
+        return
+
+    try:
+        _tesserocr_api = tesserocr.PyTessBaseAPI(lang="eng", psm=tesserocr.PSM.AUTO)
+    except RuntimeError:
+        # Language data not found, use the tesseract executable instead
+        _tesserocr_api = None
+
+
+def _close_ocr_process():
+    """Release the PDF and the Tesseract API held by an OCR worker process."""
+    global _ocr_document, _ocr_document_identity, _tesserocr_api
+
+    if _ocr_document is not None:
+        _ocr_document.close()
+        _ocr_document = None
+        _ocr_document_identity = None
+
+    if _tesserocr_api is not None:
+        _tesserocr_api.End()
+        _tesserocr_api = None
+
+
+def _open_ocr_document(pdf_path: str) -> "fitz.Document":
+    """
+    Return the PDF open in this OCR worker process, opening it if needed.
+
+    The process pool outlives a single run, so the document is reopened
+    whenever a different file, or a changed one, is processed.
+
+    Args:
+        pdf_path: Path to the PDF file.
+
+    Returns:
+        The open document.
+    """
+    global _ocr_document, _ocr_document_identity
+
+    stat = os.stat(pdf_path)
+    identity = (os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size)
+    if identity != _ocr_document_identity:
+        if _ocr_document is not None:
+            _ocr_document.close()
+        _ocr_document = fitz.open(pdf_path)
+        _ocr_document_identity = identity
+
+    return _ocr_document
+
+
+def warm_up_ocr_process() -> Optional[str]:
+    """
+    Load the OCR engine of an OCR worker process by running it on a tiny image.
+
+    Returns:
+        None when OCR works, otherwise a description of the problem.
+    """
+    if _tesserocr_api is None:
+        tesseract_cmd = pytesseract.pytesseract.tesseract_cmd
+        if shutil.which(tesseract_cmd) is None:
+            return f"Tesseract executable '{tesseract_cmd}' not found."
+
+    try:
+        # Loads the executable, its libraries and language data from disk
+        _ocr_image(Image.new("L", (10, 10), 255))
+    except Exception as e:
+        return str(e)
+
+    return None
+
+
+def _otsu_threshold(histogram: List[int]) -> int:
+    """
+    Compute Otsu's binarization threshold for a grayscale image.
+
+    Args:
+        histogram: 256-bin histogram of an 8-bit grayscale image.
+
+    Returns:
+        The gray level that best separates text from background.
+    """
+    total = sum(histogram)
+    sum_all = sum(level * count for level, count in enumerate(histogram))
+
+    weight_background = 0
+    sum_background = 0
+    best_threshold = 0
+    best_variance = 0.0
+
+    for level, count in enumerate(histogram):
+        weight_background += count
+        if weight_background == 0:
+            continue
+
+        weight_foreground = total - weight_background
+        if weight_foreground == 0:
+            break
+
+        sum_background += level * count
+        mean_background = sum_background / weight_background
+        mean_foreground = (sum_all - sum_background) / weight_foreground
+
+        # Maximize the variance between background and foreground classes
+        variance = weight_background * weight_foreground * (mean_background - mean_foreground) ** 2
+        if variance > best_variance:
+            best_variance = variance
+            best_threshold = level
+
+    return best_threshold
+
+
+def _ocr_image(image: Image.Image) -> str:
+    """
+    OCR a grayscale page image.
+
+    Args:
+        image: 8-bit grayscale ("L" mode) image.
+
+    Returns:
+        The text recognized in the image.
+    """
+    # Binarize, clean black and white input is faster for Tesseract
+    threshold = _otsu_threshold(image.histogram())
+    image = image.point(lambda p: 255 if p > threshold else 0)
+
+    if _tesserocr_api is not None:
+        # Hand over the raw 8-bit pixels, SetImage() would encode and decode
+        # the image first
+        width, height = image.size
+        _tesserocr_api.SetImageBytes(image.tobytes(), width, height, 1, width)
+        return _tesserocr_api.GetUTF8Text()
+
+    try:
+        return pytesseract.image_to_string(image)
+    except pytesseract.TesseractNotFoundError as e:
+        # This exception can't be unpickled in the parent process
+        raise RuntimeError(str(e)) from None
+
+
+def ocr_pdf_page(pdf_path: str, page_index: int) -> Tuple[str, Optional[str]]:
+    """
+    Render and OCR a single page of a PDF. Runs in an OCR worker process.
+
+    Args:
+        pdf_path: Path to the PDF file.
+        page_index: Zero-based page number.
+
+    Returns:
+        The text recognized on the page, and the page image's OCR cache key
+        (None when there is no cache).
+    """
+    # Render at 300 DPI (PDF user space is 72 DPI), but scale large
+    # pages down so they are no wider than this many pixels
+    zoom = 300 / 72
+    max_width = 3500
+
+    # Render this specific page as grayscale without alpha, the
+    # preferred input format for Tesseract
+    page = _open_ocr_document(pdf_path).load_page(page_index)
+    page_zoom = min(zoom, max_width / page.rect.width)
+    pix = page.get_pixmap(
+        matrix=fitz.Matrix(page_zoom, page_zoom),
+        colorspace=fitz.csGRAY,
+        alpha=False
+    )
+
+    try:
+        # Use the pixel data in place, without copying it out of the pixmap
+        samples = pix.samples_mv
+
+        content_key = None
+        if _ocr_cache:
+            content_key = _ocr_cache.content_key(samples)
+            cached_text = _ocr_cache.get(content_key)
+            if cached_text is not None:
+                return cached_text, content_key
+
+        image = Image.frombuffer("L", (pix.width, pix.height), samples, "raw", "L", 0, 1)
+        try:
+            text = _ocr_image(image)
+        finally:
+            # The image shares the pixmap's memory, release it before the pixmap
+            image.close()
+            del image
+    finally:
+        # Free the page buffer now rather than whenever the garbage collector runs
+        del samples
+        pix = None
+
+    if _ocr_cache:
+        _ocr_cache.put(content_key, text)
+
+    return text, content_key
+
+
+class OCRCache:
+    """
+    On-disk cache of OCR results, keyed by a hash of the rendered page image.
+
+    Pages are also indexed by PDF path, modification time and page number, so
+    pages of an unchanged PDF skip rendering and hashing altogether. Cache
+    failures are never fatal, they only make OCR run again.
+    """
+
+    # Bump whenever page rendering or preprocessing changes, so cached text
+    # from older versions is not reused
+    OCR_VERSION = 2
+
+    # Least recently used entries are evicted beyond this size
+    MAX_SIZE_BYTES = 500 * 1024 * 1024
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+        self.pages_dir = cache_dir / "pages"
+        try:
+            self.pages_dir.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass
+
+    def page_key(self, pdf_path: str, page_index: int) -> str:
+        """Build the cheap lookup key for a page of a PDF file as it is on disk."""
+        stat = os.stat(pdf_path)
+        identity = (
+            f"{self.OCR_VERSION}:{os.path.abspath(pdf_path)}:"
+            f"{stat.st_mtime_ns}:{stat.st_size}:{page_index}"
+        )
+        return hashlib.blake2b(identity.encode("utf-8"), digest_size=16).hexdigest()
+
+    def content_key(self, samples) -> str:
+        """Build the lookup key for a rendered page image."""
+        digest = hashlib.blake2b(f"{self.OCR_VERSION}:".encode("utf-8"), digest_size=16)
+        digest.update(samples)
+        return digest.hexdigest()
+
+    def get(self, content_key: str) -> Optional[str]:
+        """Return the cached OCR text for a page image, or None."""
+        return self._read(self.cache_dir / f"{content_key}.txt")
+
+    def get_page(self, page_key: str) -> Optional[str]:
+        """Return the cached OCR text for a page of an unchanged PDF, or None."""
+        content_key = self._read(self.pages_dir / page_key)
+        if content_key is None:
+            return None
+        return self.get(content_key)
+
+    def put(self, content_key: str, text: str):
+        """Store the OCR text for a page image."""
+        self._write(self.cache_dir / f"{content_key}.txt", text)
+
+    def put_page(self, page_key: str, content_key: str):
+        """Index the cached OCR text for a page image by page of an unchanged PDF."""
+        self._write(self.pages_dir / page_key, content_key)
+
+    def prune(self):
+        """Evict least recently used entries until the cache fits its size limit."""
+        try:
+            entries = []
+            for directory in (self.cache_dir, self.pages_dir):
+                for entry in os.scandir(directory):
+                    if entry.is_file():
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+            total_size = sum(size for _, size, _ in entries)
+            for _, size, path in sorted(entries):
+                if total_size <= self.MAX_SIZE_BYTES:
+                    break
+                os.remove(path)
+                total_size -= size
+        except OSError:
+            pass
+
+    def _read(self, path: Path) -> Optional[str]:
+        try:
+            text = path.read_text(encoding="utf-8")
+            # Refresh the modification time, used as last access for eviction
+            os.utime(path)
+            return text
+        except OSError:
+            return None
+
+    def _write(self, path: Path, text: str):
+        # Write to a temporary file first so readers never see partial entries
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            tmp_path.write_text(text, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
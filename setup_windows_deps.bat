@@ -1,6 +1,6 @@
 @echo off
 REM Setup script for Windows dependencies
-REM This script downloads and installs Tesseract OCR and Poppler for the Word Estimator application
+REM This script downloads and installs Tesseract OCR for the Word Estimator application
 
 echo ========================================
 echo Word Estimator - Windows Setup
@@ -20,7 +20,6 @@ if %errorLevel% == 0 (
 echo.
 echo This script will download and install required dependencies:
 echo - Tesseract OCR (for text extraction from images)
-echo - Poppler (for PDF processing)
 echo.
 pause
 
@@ -48,27 +47,6 @@ if exist "%TESSERACT_INSTALLER%" (
     echo Please download manually from: https://github.com/UB-Mannheim/tesseract/wiki
 )
 
-REM Download Poppler
-echo.
-echo ========================================
-echo Downloading Poppler...
-echo ========================================
-set POPPLER_URL=https://github.com/oschwartz10612/poppler-windows/releases/download/v24.08.0-0/Release-24.08.0-0.zip
-set POPPLER_ZIP=%TEMP_DIR%\poppler.zip
-set POPPLER_DIR=%ProgramFiles%\poppler
-
-powershell -Command "& {Invoke-WebRequest -Uri '%POPPLER_URL%' -OutFile '%POPPLER_ZIP%'}"
-
-if exist "%POPPLER_ZIP%" (
-    echo Download complete!
-    echo Extracting Poppler...
-    powershell -Command "& {Expand-Archive -Path '%POPPLER_ZIP%' -DestinationPath '%POPPLER_DIR%' -Force}"
-    echo Poppler installed to: %POPPLER_DIR%
-) else (
-    echo Failed to download Poppler.
-    echo Please download manually from: https://github.com/oschwartz10612/poppler-windows/releases
-)
-
 REM Add to PATH
 echo.
 echo ========================================
@@ -79,16 +57,12 @@ REM Add Tesseract to PATH
 set TESSERACT_PATH=C:\Program Files\Tesseract-OCR
 powershell -Command "& {[Environment]::SetEnvironmentVariable('Path', [Environment]::GetEnvironmentVariable('Path', 'Machine') + ';%TESSERACT_PATH%', 'Machine')}"
 
-REM Add Poppler to PATH
-set POPPLER_BIN=%POPPLER_DIR%\poppler-24.08.0\Library\bin
-powershell -Command "& {[Environment]::SetEnvironmentVariable('Path', [Environment]::GetEnvironmentVariable('Path', 'Machine') + ';%POPPLER_BIN%', 'Machine')}"
-
 echo.
 echo ========================================
 echo Setup Complete!
 echo ========================================
 echo.
-echo Tesseract and Poppler have been installed.
+echo Tesseract has been installed.
 echo You may need to restart your computer for PATH changes to take effect.
 echo.
 echo After restarting, you can run word_estimator.exe